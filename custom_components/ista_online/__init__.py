@@ -1,11 +1,34 @@
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from .const import DOMAIN, PLATFORMS, COUNTRY_OPTIONS
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+from .const import (
+    DOMAIN,
+    PLATFORMS,
+    COUNTRY_OPTIONS,
+    CONF_OFFLOAD_LARGE_PAYLOADS,
+    DEFAULT_OFFLOAD_LARGE_PAYLOADS,
+    METERS_OFFLOAD_THRESHOLD_BYTES,
+    DATA_READING_STORE,
+)
 from .coordinator import ISTACoordinator
+from .services import async_setup_services
+from .store import ReadingStore
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    hass.data.setdefault(DOMAIN, {})[DATA_READING_STORE] = ReadingStore(
+        hass.config.path(".storage", DOMAIN, "readings")
+    )
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     country = entry.data.get("country")
     username = entry.data.get("username")
@@ -16,18 +39,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Unknown country selection: %s", country)
         return False
 
-    coordinator = ISTACoordinator(hass, base_url, username, password)
+    offload = entry.options.get(CONF_OFFLOAD_LARGE_PAYLOADS, DEFAULT_OFFLOAD_LARGE_PAYLOADS)
+    coordinator = ISTACoordinator(
+        hass,
+        base_url,
+        username,
+        password,
+        hass.data[DOMAIN][DATA_READING_STORE],
+        entry.entry_id,
+        METERS_OFFLOAD_THRESHOLD_BYTES if offload else None,
+    )
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    store = hass.data.get(DOMAIN, {}).get(DATA_READING_STORE)
+    if store:
+        await hass.async_add_executor_job(store.remove_owner, entry.entry_id)
@@ -1,3 +1,4 @@
+import json
 import requests
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple, Union
@@ -71,7 +72,13 @@ class TokenError(TokenResult):
         self.http_status = http_status
 
 
-def fetch_token(url: str, username: str, password: str, timeout: float = 10.0) -> Union[TokenSuccess, TokenError]:
+def fetch_token(
+    url: str,
+    username: str,
+    password: str,
+    timeout: float = 10.0,
+    session: Optional[requests.Session] = None,
+) -> Union[TokenSuccess, TokenError]:
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
     payload = {
         "grant_type": "password",
@@ -80,7 +87,7 @@ def fetch_token(url: str, username: str, password: str, timeout: float = 10.0) -
     }
 
     try:
-        resp = requests.post(f"{url.rstrip('/')}/token", headers=headers, data=payload, timeout=timeout)
+        resp = (session or requests).post(f"{url.rstrip('/')}/token", headers=headers, data=payload, timeout=timeout)
     except requests.RequestException as e:
         return TokenError("request_exception", str(e), None, {"exception": str(e)})
 
@@ -98,9 +105,11 @@ def fetch_token(url: str, username: str, password: str, timeout: float = 10.0) -
     return TokenSuccess(data)
 
 
-def fetch_user_info(base_url: str, bearer: str, timeout: float = 10.0) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+def fetch_user_info(
+    base_url: str, bearer: str, timeout: float = 10.0, session: Optional[requests.Session] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     try:
-        resp = requests.get(f"{base_url.rstrip('/')}/api/GetUserInfo", headers={"Authorization": bearer}, timeout=timeout)
+        resp = (session or requests).get(f"{base_url.rstrip('/')}/api/GetUserInfo", headers={"Authorization": bearer}, timeout=timeout)
     except requests.RequestException as e:
         return None, f"Request failed: {e}"
 
@@ -118,32 +127,52 @@ def fetch_user_info(base_url: str, bearer: str, timeout: float = 10.0) -> Tuple[
     return data, None
 
 
-def fetch_meters(base_url: str, bearer: str, timeout: float = 10.0) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+def meters_payload_error(data: Dict[str, Any]) -> Optional[str]:
+    err_msg = data.get("errorMessage") or {}
+    if any(err_msg.get(k) for k in ("ErrorType", "UserMessage", "InternalMessage")):
+        parts = []
+        if err_msg.get("ErrorType"):
+            parts.append(f"ErrorType: {err_msg.get('ErrorType')}")
+        if err_msg.get("UserMessage"):
+            parts.append(f"UserMessage: {err_msg.get('UserMessage')}")
+        if err_msg.get("InternalMessage"):
+            parts.append(f"InternalMessage: {err_msg.get('InternalMessage')}")
+        return "; ".join(parts)
+    return None
+
+
+def fetch_meters_content(
+    base_url: str, bearer: str, timeout: float = 10.0, session: Optional[requests.Session] = None
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """Fetch the raw Meters response body, leaving decoding to the caller."""
     try:
-        resp = requests.get(f"{base_url.rstrip('/')}/api/Meters", headers={"Authorization": bearer}, timeout=timeout)
+        resp = (session or requests).get(f"{base_url.rstrip('/')}/api/Meters", headers={"Authorization": bearer}, timeout=timeout)
     except requests.RequestException as e:
         return None, f"Request failed: {e}"
 
     if resp.status_code != 200:
         return None, f"HTTP {resp.status_code}"
 
+    return resp.content, None
+
+
+def fetch_meters(
+    base_url: str, bearer: str, timeout: float = 10.0, session: Optional[requests.Session] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    content, err = fetch_meters_content(base_url, bearer, timeout=timeout, session=session)
+    if err:
+        return None, err
+
     try:
-        data = resp.json()
+        data = json.loads(content)
     except ValueError:
         return None, "Invalid JSON from Meters"
 
     if not isinstance(data, dict):
         return None, "Unexpected meters payload shape"
 
-    err_msg = data.get("errorMessage") or {}
-    if any(err_msg.get(k) for k in ("ErrorType", "UserMessage", "InternalMessage")):
-        parts = []
-        if err_msg.get("ErrorType"):
-            parts.append(f"ErrorType: {err_msg.get('ErrorType')}")
-        if err_msg.get("UserMessage"):
-            parts.append(f"UserMessage: {err_msg.get('UserMessage')}")
-        if err_msg.get("InternalMessage"):
-            parts.append(f"InternalMessage: {err_msg.get('InternalMessage')}")
-        return None, "; ".join(parts)
+    err = meters_payload_error(data)
+    if err:
+        return None, err
 
     return data, None
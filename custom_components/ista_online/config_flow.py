@@ -1,6 +1,6 @@
 from homeassistant import config_entries
 import voluptuous as vol
-from .const import DOMAIN, COUNTRY_OPTIONS, DEFAULT_COUNTRY
+from .const import DOMAIN, COUNTRY_OPTIONS, DEFAULT_COUNTRY, CONF_OFFLOAD_LARGE_PAYLOADS, DEFAULT_OFFLOAD_LARGE_PAYLOADS
 from typing import Any, Dict
 from .api_client import fetch_token, TokenSuccess
 from homeassistant.config_entries import ConfigEntry
@@ -87,6 +87,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self.config_flow = config_flow
 
     async def async_step_init(self, user_input: Dict[str, Any] = None):
+        return self.async_show_menu(step_id="init", menu_options=["credentials", "performance"])
+
+    async def async_step_credentials(self, user_input: Dict[str, Any] = None):
         errors: Dict[str, str] = {}
         current = self.config_entry.data if self.config_entry else {}
         if user_input is not None:
@@ -106,7 +109,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     else:
                         new_data = {"country": country, "username": username, "password": password}
                         self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
-                        return self.async_create_entry(title="", data={})
+                        return self.async_create_entry(title="", data=dict(self.config_entry.options))
 
         schema = vol.Schema(
             {
@@ -115,4 +118,20 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required("password"): str,
             }
         )
-        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="credentials", data_schema=schema, errors=errors)
+
+    async def async_step_performance(self, user_input: Dict[str, Any] = None):
+        options = self.config_entry.options if self.config_entry else {}
+        if user_input is not None:
+            offload = bool(user_input.get(CONF_OFFLOAD_LARGE_PAYLOADS, DEFAULT_OFFLOAD_LARGE_PAYLOADS))
+            return self.async_create_entry(title="", data={**options, CONF_OFFLOAD_LARGE_PAYLOADS: offload})
+
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_OFFLOAD_LARGE_PAYLOADS,
+                    default=options.get(CONF_OFFLOAD_LARGE_PAYLOADS, DEFAULT_OFFLOAD_LARGE_PAYLOADS),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="performance", data_schema=schema)
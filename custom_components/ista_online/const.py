@@ -8,3 +8,13 @@ COUNTRY_OPTIONS = {
 DEFAULT_COUNTRY = "Denmark"
 
 UPDATE_INTERVAL_SECONDS = 3600  # 1 hour
+
+# hass.data[DOMAIN] key of the ReadingStore shared by all config entries.
+DATA_READING_STORE = "reading_store"
+
+# Meters responses of at least this size are decoded in a child process
+# instead of the executor thread, unless disabled in the entry options.
+CONF_OFFLOAD_LARGE_PAYLOADS = "offload_large_payloads"
+DEFAULT_OFFLOAD_LARGE_PAYLOADS = True
+METERS_OFFLOAD_THRESHOLD_BYTES = 4 * 1024 * 1024
+METERS_WORKER_TIMEOUT_SECONDS = 60
@@ -2,11 +2,13 @@ import asyncio
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from datetime import timedelta
 
 from . import const
-from .api_client import fetch_token, fetch_user_info, fetch_meters, TokenSuccess
+from .api_client import fetch_token, fetch_user_info, fetch_meters_content, meters_payload_error, TokenSuccess
+from .processing import MetersDecoder
+from .store import ReadingStore
 
 import logging
 
@@ -14,7 +16,16 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class ISTACoordinator(DataUpdateCoordinator):
-    def __init__(self, hass: HomeAssistant, base_url: str, username: str, password: str):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        base_url: str,
+        username: str,
+        password: str,
+        reading_store: ReadingStore,
+        entry_id: str,
+        offload_threshold: Optional[int] = const.METERS_OFFLOAD_THRESHOLD_BYTES,
+    ):
         super().__init__(
             hass,
             _LOGGER,
@@ -26,6 +37,9 @@ class ISTACoordinator(DataUpdateCoordinator):
         self.password = password
         self.user_info: Dict[str, Any] = {}
         self.meters: Dict[str, Any] = {}
+        self.meters_decoder = MetersDecoder(offload_threshold, const.METERS_WORKER_TIMEOUT_SECONDS)
+        self.entry_id = entry_id
+        self.reading_store = reading_store
 
     async def _async_update_data(self) -> Dict[str, Any]:
         def sync_fetch():
@@ -42,10 +56,23 @@ class ISTACoordinator(DataUpdateCoordinator):
             if err:
                 raise UpdateFailed(f"UserInfo error: {err}")
 
-            meters_data, err = fetch_meters(self.base_url, bearer)
+            meters_content, err = fetch_meters_content(self.base_url, bearer)
             if err:
                 raise UpdateFailed(f"Meters error: {err}")
 
+            meters_data, err = self.meters_decoder.decode(meters_content)
+            if not err:
+                err = meters_payload_error(meters_data)
+            if err:
+                raise UpdateFailed(f"Meters error: {err}")
+
+            try:
+                self.reading_store.record_meters(
+                    ((meters_data or {}).get("Meters") or {}).get("Value") or [], owner=self.entry_id
+                )
+            except OSError as e:
+                _LOGGER.warning("Could not store meter readings: %s", e)
+
             return {
                 "token": token_result,
                 "user_info": user_info or {},
@@ -0,0 +1,150 @@
+"""Decoding and normalization of the Meters payload.
+
+This module only imports the standard library. Large payloads are decoded by
+running this file as a script in a short-lived ``python -I`` child process,
+which therefore never imports Home Assistant or the integration package.
+"""
+import json
+import pickle
+import re
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Meter fields used by the integration; everything else is dropped so the
+# structure handed back from the worker process stays small.
+METER_FIELDS = (
+    "METER_ID",
+    "METER_NO",
+    "METCAT_LABEL",
+    "ROOM_DESCR",
+    "Unit",
+    "MeterType",
+    "METTYPE_CODE",
+    "MeterText",
+    "Last_Meter_Reading",
+    "Last_Meter_Consumption",
+    "Reading_date",
+    "Activation_date",
+    "Deactivation_date",
+    "Message",
+    "Headline",
+)
+
+DATE_FIELDS = ("Reading_date", "Activation_date", "Deactivation_date")
+
+
+def normalize_unit(unit: Any) -> Any:
+    if isinstance(unit, str):
+        if unit.lower() == "m3":
+            return "m³"
+        if unit.lower() == "kwh":
+            return "kWh"
+    return unit
+
+
+def parse_date_string(value: Any) -> Optional[datetime]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        # Reading_date is in format "23-07-2025"
+        if re.match(r"\d{2}-\d{2}-\d{4}$", value.strip()):
+            dt = datetime.strptime(value.strip(), "%d-%m-%Y")
+            return dt.replace(tzinfo=timezone.utc)
+        s = value.strip()
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        dt = datetime.fromisoformat(s)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except Exception:
+        return None
+
+
+def preprocess_meters(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a decoded Meters payload to the fields the integration uses.
+
+    Units are normalized and date fields converted to ISO 8601 strings. The
+    result keeps the ``Meters.Value`` shape and adds ``by_id``, an index of the
+    same meters keyed by ``str(METER_ID)``.
+    """
+    meters: List[Dict[str, Any]] = []
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for m in (data.get("Meters") or {}).get("Value") or []:
+        if not isinstance(m, dict):
+            continue
+        meter = {k: m[k] for k in METER_FIELDS if k in m}
+        if "Unit" in meter:
+            meter["Unit"] = normalize_unit(meter["Unit"])
+        for key in DATE_FIELDS:
+            dt = parse_date_string(meter.get(key))
+            if dt:
+                meter[key] = dt.isoformat()
+        meters.append(meter)
+        if meter.get("METER_ID") is not None:
+            by_id[str(meter["METER_ID"])] = meter
+    return {
+        "errorMessage": data.get("errorMessage"),
+        "Meters": {"Value": meters},
+        "by_id": by_id,
+    }
+
+
+def decode_meters_payload(content: bytes) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return None, "Invalid JSON from Meters"
+
+    if not isinstance(data, dict):
+        return None, "Unexpected meters payload shape"
+
+    return preprocess_meters(data), None
+
+
+class MetersDecoder:
+    """Decode Meters payloads, in a child process above a size threshold.
+
+    Small payloads are decoded in the calling thread. Payloads of at least
+    ``threshold`` bytes are piped to a fresh interpreter running this module,
+    so JSON decoding and normalization do not hold the GIL of the caller; only
+    unpickling the compact result does. The child exits after each payload.
+    A threshold of ``None`` disables the child process. If the child fails or
+    takes longer than ``timeout`` seconds it is killed and the payload is
+    decoded in-thread. Calls block and must run in the executor.
+    """
+
+    def __init__(self, threshold: Optional[int], timeout: float = 60.0):
+        self.threshold = threshold
+        self.timeout = timeout
+
+    def decode(self, content: bytes) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        if self.threshold is None or len(content) < self.threshold:
+            return decode_meters_payload(content)
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-I", __file__],
+                input=content,
+                capture_output=True,
+                timeout=self.timeout,
+                check=True,
+            )
+            return pickle.loads(proc.stdout)
+        except (subprocess.SubprocessError, OSError, pickle.UnpicklingError, EOFError) as e:
+            _LOGGER.warning("Meters worker process failed, decoding in thread: %s", e)
+            return decode_meters_payload(content)
+
+
+def _main() -> None:
+    result = decode_meters_payload(sys.stdin.buffer.read())
+    sys.stdout.buffer.write(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+if __name__ == "__main__":
+    _main()
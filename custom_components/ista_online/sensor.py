@@ -3,8 +3,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from .const import DOMAIN
 from typing import Any, Optional
-from datetime import datetime, timezone
-import re
 
 DIAGNOSTIC_FIELDS = {
     "Activation date": "Activation_date",
@@ -35,13 +33,10 @@ def _map_device_class(meter_type: Any):
     return None
 
 
-def _normalize_unit(unit: Any) -> Any:
-    if isinstance(unit, str):
-        if unit.lower() == "m3":
-            return "m³"
-        if unit.lower() == "kwh":
-            return "kWh"
-    return unit
+def _find_meter(data: dict, meter_id: Any) -> Optional[dict]:
+    meters = (data or {}).get("meters", {}) or {}
+    return (meters.get("by_id") or {}).get(str(meter_id))
+
 
 def _suggest_precision_for_unit(native_unit: str | None) -> int | None:
     """Return suggested precision for known units."""
@@ -50,25 +45,6 @@ def _suggest_precision_for_unit(native_unit: str | None) -> int | None:
     return None
 
 
-def _parse_date_string(value: Any) -> Optional[datetime]:
-    if not value or not isinstance(value, str):
-        return None
-    try:
-        # Reading_date is in format "23-07-2025"
-        if re.match(r"\d{2}-\d{2}-\d{4}$", value.strip()):
-            dt = datetime.strptime(value.strip(), "%d-%m-%Y")
-            return dt.replace(tzinfo=timezone.utc)
-        s = value.strip()
-        if s.endswith("Z"):
-            s = s[:-1] + "+00:00"
-        dt = datetime.fromisoformat(s)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
-    except Exception:
-        return None
-
-
 class MeterSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, meter: dict, user_info: dict):
         super().__init__(coordinator)
@@ -91,7 +67,8 @@ class MeterSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_unit_of_measurement(self) -> Any:
-        return _normalize_unit(self._meter.get("Unit"))
+        # Already normalized by processing.preprocess_meters.
+        return self._meter.get("Unit")
     
     @property
     def native_precision(self) -> int | None:
@@ -127,12 +104,9 @@ class MeterSensor(CoordinatorEntity, SensorEntity):
         return {k: v for k, v in attrs.items() if v is not None}
 
     def _handle_coordinator_update(self) -> None:
-        meters = self.coordinator.data.get("meters", {}) or {}
-        meters_value = (meters.get("Meters") or {}).get("Value") or []
-        for m in meters_value:
-            if str(m.get("METER_ID")) == str(self._meter.get("METER_ID")):
-                self._meter = m
-                break
+        meter = _find_meter(self.coordinator.data, self._meter.get("METER_ID"))
+        if meter is not None:
+            self._meter = meter
         self.async_write_ha_state()
 
 
@@ -158,7 +132,8 @@ class MeterConsumptionSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_unit_of_measurement(self) -> Any:
-        return _normalize_unit(self._meter.get("Unit"))
+        # Already normalized by processing.preprocess_meters.
+        return self._meter.get("Unit")
 
     @property
     def native_precision(self) -> int | None:
@@ -193,12 +168,9 @@ class MeterConsumptionSensor(CoordinatorEntity, SensorEntity):
         return {k: v for k, v in attrs.items() if v is not None}
 
     def _handle_coordinator_update(self) -> None:
-        meters = self.coordinator.data.get("meters", {}) or {}
-        meters_value = (meters.get("Meters") or {}).get("Value") or []
-        for m in meters_value:
-            if str(m.get("METER_ID")) == str(self._meter.get("METER_ID")):
-                self._meter = m
-                break
+        meter = _find_meter(self.coordinator.data, self._meter.get("METER_ID"))
+        if meter is not None:
+            self._meter = meter
         self.async_write_ha_state()
 
 
@@ -222,11 +194,7 @@ class MeterDiagnosticSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> Any:
-        # parse dates for certain fields
-        if self._field_key in ("Reading_date", "Activation_date", "Deactivation_date"):
-            dt = _parse_date_string(self._meter.get(self._field_key))
-            if dt:
-                return dt.isoformat()
+        # Date fields are already ISO 8601 from processing.preprocess_meters.
         return self._meter.get(self._field_key)
 
     @property
@@ -256,12 +224,9 @@ class MeterDiagnosticSensor(CoordinatorEntity, SensorEntity):
         )
 
     def _handle_coordinator_update(self) -> None:
-        meters = self.coordinator.data.get("meters", {}) or {}
-        meters_value = (meters.get("Meters") or {}).get("Value") or []
-        for m in meters_value:
-            if str(m.get("METER_ID")) == str(self._meter.get("METER_ID")):
-                self._meter = m
-                break
+        meter = _find_meter(self.coordinator.data, self._meter.get("METER_ID"))
+        if meter is not None:
+            self._meter = meter
         self.async_write_ha_state()
 
 
@@ -0,0 +1,79 @@
+from datetime import date, datetime, time, timezone
+from typing import Any, Dict, Optional
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN, DATA_READING_STORE
+from .coordinator import ISTACoordinator
+
+SERVICE_GET_READINGS = "get_readings"
+WS_TYPE_GET_READINGS = f"{DOMAIN}/{SERVICE_GET_READINGS}"
+
+GET_READINGS_FIELDS = {
+    vol.Required("meter_id"): cv.string,
+    vol.Optional("start"): cv.date,
+    vol.Optional("end"): cv.date,
+}
+
+
+def _resolve_meter_id(hass: HomeAssistant, meter_id: str) -> Optional[str]:
+    """Return the METER_ID of a known meter given its METER_ID or METER_NO."""
+    coordinators = [c for c in hass.data.get(DOMAIN, {}).values() if isinstance(c, ISTACoordinator)]
+    for coordinator in coordinators:
+        if meter_id in (coordinator.meters.get("by_id") or {}):
+            return meter_id
+    for coordinator in coordinators:
+        for m in (coordinator.meters.get("Meters") or {}).get("Value") or []:
+            if str(m.get("METER_NO")) == meter_id:
+                return str(m.get("METER_ID"))
+    return None
+
+
+async def _async_get_readings(
+    hass: HomeAssistant, meter_id: str, start: Optional[date], end: Optional[date]
+) -> Dict[str, Any]:
+    store_id = _resolve_meter_id(hass, meter_id)
+    if store_id is None:
+        raise HomeAssistantError(f"Unknown ISTA meter: {meter_id}")
+    store = hass.data[DOMAIN][DATA_READING_STORE]
+
+    start_ts = int(datetime.combine(start, time.min, timezone.utc).timestamp()) if start else None
+    end_ts = int(datetime.combine(end, time.max, timezone.utc).timestamp()) if end else None
+    readings = await hass.async_add_executor_job(store.get_readings, store_id, start_ts, end_ts)
+    return {
+        "meter_id": store_id,
+        "readings": [
+            {"date": datetime.fromtimestamp(ts, timezone.utc).isoformat(), "value": value} for ts, value in readings
+        ],
+    }
+
+
+@websocket_api.websocket_command({vol.Required("type"): WS_TYPE_GET_READINGS, **GET_READINGS_FIELDS})
+@websocket_api.async_response
+async def _ws_get_readings(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict) -> None:
+    try:
+        result = await _async_get_readings(hass, msg["meter_id"], msg.get("start"), msg.get("end"))
+    except HomeAssistantError as e:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(e))
+        return
+    connection.send_result(msg["id"], result)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    async def handle_get_readings(call: ServiceCall) -> ServiceResponse:
+        return await _async_get_readings(hass, call.data["meter_id"], call.data.get("start"), call.data.get("end"))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_READINGS,
+        handle_get_readings,
+        schema=vol.Schema(GET_READINGS_FIELDS),
+        supports_response=SupportsResponse.ONLY,
+    )
+    websocket_api.async_register_command(hass, _ws_get_readings)
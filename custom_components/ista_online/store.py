@@ -0,0 +1,143 @@
+import os
+import re
+import struct
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .processing import parse_date_string
+
+# One record per reading: UTC epoch seconds of Reading_date and the meter value.
+_RECORD = struct.Struct("<qd")
+
+
+def _parse_reading_value(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip().replace(",", "."))
+        except ValueError:
+            return None
+    return None
+
+
+class ReadingStore:
+    """Append-only per-meter time series of Last_Meter_Reading values.
+
+    Each meter is stored as a flat file of fixed size records sorted by
+    Reading_date. Series are loaded lazily into two parallel arrays so range
+    queries are a pair of binary searches. The arrays cache the files, so a
+    single instance must be shared by every config entry. Methods do blocking
+    file I/O and must run in the executor.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+        self._series: Dict[str, Tuple[array, array]] = {}
+        self._lock = threading.Lock()
+        self._directory_ready = False
+        # Meter ids reported by each config entry, used to clean up on removal.
+        self._owners: Dict[str, Set[str]] = {}
+
+    def _path(self, meter_id: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", meter_id)
+        return os.path.join(self._directory, f"{safe}.bin")
+
+    def _load(self, meter_id: str) -> Tuple[array, array]:
+        series = self._series.get(meter_id)
+        if series is not None:
+            return series
+        timestamps, values = array("q"), array("d")
+        try:
+            with open(self._path(meter_id), "rb") as fh:
+                data = fh.read()
+        except FileNotFoundError:
+            data = b""
+        # Drop a trailing partial record left by an interrupted write so later
+        # appends stay aligned to the record size.
+        usable = len(data) - len(data) % _RECORD.size
+        if usable != len(data):
+            os.truncate(self._path(meter_id), usable)
+        for ts, value in _RECORD.iter_unpack(memoryview(data)[:usable]):
+            timestamps.append(ts)
+            values.append(value)
+        series = (timestamps, values)
+        self._series[meter_id] = series
+        return series
+
+    def _rewrite(self, meter_id: str, timestamps: array, values: array) -> None:
+        path = self._path(meter_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(b"".join(_RECORD.pack(ts, value) for ts, value in zip(timestamps, values)))
+        os.replace(tmp_path, path)
+
+    def add_reading(self, meter_id: str, timestamp: int, value: float) -> bool:
+        """Store a reading unless one already exists for that Reading_date."""
+        meter_id = str(meter_id)
+        with self._lock:
+            if not self._directory_ready:
+                os.makedirs(self._directory, exist_ok=True)
+                self._directory_ready = True
+            timestamps, values = self._load(meter_id)
+            if not timestamps or timestamp > timestamps[-1]:
+                with open(self._path(meter_id), "ab") as fh:
+                    fh.write(_RECORD.pack(timestamp, value))
+                timestamps.append(timestamp)
+                values.append(value)
+                return True
+            idx = bisect_left(timestamps, timestamp)
+            if idx < len(timestamps) and timestamps[idx] == timestamp:
+                return False
+            # Out of order reading (e.g. corrected by ISTA): keep the file sorted.
+            timestamps.insert(idx, timestamp)
+            values.insert(idx, value)
+            self._rewrite(meter_id, timestamps, values)
+            return True
+
+    def record_meters(self, meters: Iterable[Dict[str, Any]], owner: Optional[str] = None) -> int:
+        """Append the current reading of each meter in a Meters payload."""
+        added = 0
+        seen: Set[str] = set()
+        for meter in meters:
+            meter_id = meter.get("METER_ID")
+            if meter_id is not None:
+                seen.add(str(meter_id))
+            reading_date = parse_date_string(meter.get("Reading_date"))
+            value = _parse_reading_value(meter.get("Last_Meter_Reading"))
+            if meter_id is None or reading_date is None or value is None:
+                continue
+            if self.add_reading(str(meter_id), int(reading_date.timestamp()), value):
+                added += 1
+        if owner is not None:
+            with self._lock:
+                self._owners.setdefault(owner, set()).update(seen)
+        return added
+
+    def remove_owner(self, owner: str) -> None:
+        """Delete the series of meters no other config entry reports."""
+        with self._lock:
+            meter_ids = self._owners.pop(owner, set())
+            for other in self._owners.values():
+                meter_ids -= other
+            for meter_id in meter_ids:
+                self._series.pop(meter_id, None)
+                try:
+                    os.remove(self._path(meter_id))
+                except FileNotFoundError:
+                    pass
+
+    def get_readings(
+        self, meter_id: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """Return (timestamp, value) pairs with start <= timestamp <= end."""
+        meter_id = str(meter_id)
+        with self._lock:
+            timestamps, values = self._load(meter_id)
+            lo = 0 if start is None else bisect_left(timestamps, start)
+            hi = len(timestamps) if end is None else bisect_right(timestamps, end)
+            return list(zip(timestamps[lo:hi], values[lo:hi]))
@@ -0,0 +1,113 @@
+"""Compare in-thread and worker process decoding of large Meters payloads.
+
+A synthetic Meters response is decoded repeatedly on a background thread, the
+way ISTACoordinator does it in the executor, while the main thread runs a
+ticker that sleeps for 1 ms at a time. Ticks that wake up late measure how
+long the decoding held the GIL. Refresh latency is the wall time of one
+decode, including interpreter startup for the child process path.
+
+Example:
+    python scripts/bench_meters_decode.py --meters 50000 --rounds 5
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+# processing does not depend on Home Assistant, but the package __init__
+# does, so import the module directly from the component folder.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "ista_online"))
+
+from processing import MetersDecoder  # noqa: E402
+
+TICK_SECONDS = 0.001
+
+
+def _synthetic_payload(count: int) -> bytes:
+    meters: List[Dict[str, Any]] = []
+    for i in range(count):
+        meters.append(
+            {
+                "METER_ID": 10_000_000 + i,
+                "METER_NO": f"{60_000_000 + i}",
+                "METCAT_LABEL": "Sensonic",
+                "ROOM_DESCR": f"Apartment {i // 4} room {i % 4}",
+                "Unit": "m3" if i % 2 else "kWh",
+                "MeterType": "CW" if i % 2 else "ENERGY",
+                "METTYPE_CODE": "KV" if i % 2 else "EN",
+                "MeterText": "Cold water" if i % 2 else "Heat",
+                "Last_Meter_Reading": round(i * 1.37, 3),
+                "Last_Meter_Consumption": round(i * 0.11, 3),
+                "Reading_date": "23-07-2025",
+                "Activation_date": "2019-01-01T00:00:00",
+                "Deactivation_date": None,
+                "Message": "",
+                "Headline": "",
+                "HistoricalReadings": [{"Date": "01-01-2025", "Value": i}] * 4,
+            }
+        )
+    payload = {"errorMessage": {}, "Meters": {"Value": meters}}
+    return json.dumps(payload).encode()
+
+
+def _measure(decoder: MetersDecoder, content: bytes, rounds: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    stalls: List[float] = []
+    done = threading.Event()
+
+    def worker() -> None:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            data, err = decoder.decode(content)
+            latencies.append(time.perf_counter() - started)
+            if err:
+                raise RuntimeError(err)
+        done.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    while not done.is_set():
+        started = time.perf_counter()
+        time.sleep(TICK_SECONDS)
+        stalls.append(max(0.0, time.perf_counter() - started - TICK_SECONDS))
+    thread.join()
+
+    return {
+        "latency_median_ms": statistics.median(latencies) * 1000,
+        "latency_max_ms": max(latencies) * 1000,
+        "stall_max_ms": max(stalls) * 1000,
+        "stall_total_ms": sum(stalls) * 1000,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark in-thread vs worker process Meters decoding.")
+    parser.add_argument("--meters", type=int, default=50_000, help="Meters in the synthetic payload")
+    parser.add_argument("--rounds", type=int, default=5, help="Decodes per mode")
+    args = parser.parse_args()
+
+    content = _synthetic_payload(args.meters)
+    print(f"payload: {args.meters} meters, {len(content) / 1024 / 1024:.1f} MiB")
+
+    in_thread = MetersDecoder(threshold=None)
+    process = MetersDecoder(threshold=0)
+    # Every offloaded decode starts a fresh interpreter; report that fixed cost.
+    started = time.perf_counter()
+    process.decode(b"{}")
+    print(f"child process round trip for an empty payload: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    for name, decoder in (("in-thread", in_thread), ("process", process)):
+        r = _measure(decoder, content, args.rounds)
+        print(
+            f"{name:>9}: latency median {r['latency_median_ms']:.0f} ms, max {r['latency_max_ms']:.0f} ms; "
+            f"GIL stall max {r['stall_max_ms']:.1f} ms, total {r['stall_total_ms']:.0f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""Bulk export of ISTA Online meters and user info, outside Home Assistant.
+
+Reads a CSV of accounts (columns: username, password and optionally country)
+and writes one row per meter to CSV or JSON Lines. Accounts are fetched
+concurrently over a shared connection pool and rows are written as soon as
+each account completes.
+
+Example:
+    python scripts/ista_export.py accounts.csv -o meters.csv
+    python scripts/ista_export.py accounts.csv --format jsonl --concurrency 16
+    python scripts/ista_export.py accounts.csv -o /dev/null --benchmark
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# api_client and const do not depend on Home Assistant, but the package
+# __init__ does, so import the modules directly from the component folder.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "ista_online"))
+
+from api_client import TokenSuccess, fetch_meters, fetch_token, fetch_user_info  # noqa: E402
+from const import COUNTRY_OPTIONS, DEFAULT_COUNTRY  # noqa: E402
+
+CSV_COLUMNS = [
+    "account",
+    "METER_ID",
+    "METER_NO",
+    "MeterType",
+    "METTYPE_CODE",
+    "METCAT_LABEL",
+    "ROOM_DESCR",
+    "Unit",
+    "Last_Meter_Reading",
+    "Last_Meter_Consumption",
+    "Reading_date",
+    "Activation_date",
+    "Deactivation_date",
+    "Address",
+    "ZipCity",
+    "error",
+]
+
+
+def _read_accounts(fh: TextIO) -> Iterator[Dict[str, str]]:
+    for row in csv.DictReader(fh):
+        username = (row.get("username") or "").strip()
+        if not username:
+            continue
+        yield {
+            "username": username,
+            "password": row.get("password") or "",
+            "country": (row.get("country") or "").strip() or DEFAULT_COUNTRY,
+        }
+
+
+def _export_account(account: Dict[str, str], session: requests.Session, timeout: float) -> Dict[str, Any]:
+    result: Dict[str, Any] = {"account": account["username"], "user_info": {}, "meters": [], "error": None}
+    # One malformed account must not abort the export of all the others.
+    try:
+        _fetch_account(account, session, timeout, result)
+    except Exception as e:
+        result["error"] = f"Unexpected error: {e!r}"
+    return result
+
+
+def _fetch_account(account: Dict[str, str], session: requests.Session, timeout: float, result: Dict[str, Any]) -> None:
+    base_url = COUNTRY_OPTIONS.get(account["country"])
+    if not base_url:
+        result["error"] = f"Unknown country: {account['country']}"
+        return
+
+    token_result = fetch_token(base_url, account["username"], account["password"], timeout=timeout, session=session)
+    if not isinstance(token_result, TokenSuccess):
+        result["error"] = f"Token error: {token_result.error_description or token_result.error}"
+        return
+    bearer = token_result.auth_header()
+
+    user_info, err = fetch_user_info(base_url, bearer, timeout=timeout, session=session)
+    if err:
+        result["error"] = f"UserInfo error: {err}"
+        return
+    result["user_info"] = user_info or {}
+
+    meters_data, err = fetch_meters(base_url, bearer, timeout=timeout, session=session)
+    if err:
+        result["error"] = f"Meters error: {err}"
+        return
+    meters = ((meters_data or {}).get("Meters") or {}).get("Value") or []
+    result["meters"] = [m for m in meters if isinstance(m, dict)] if isinstance(meters, list) else []
+
+
+class _CsvWriter:
+    def __init__(self, fh: TextIO):
+        self._writer = csv.DictWriter(fh, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, result: Dict[str, Any]) -> None:
+        user_info = result["user_info"]
+        base = {
+            "account": result["account"],
+            "Address": user_info.get("Address"),
+            "ZipCity": user_info.get("ZipCity"),
+            "error": result["error"],
+        }
+        if not result["meters"]:
+            self._writer.writerow(base)
+            return
+        for meter in result["meters"]:
+            self._writer.writerow({**meter, **base})
+
+
+class _JsonLinesWriter:
+    def __init__(self, fh: TextIO):
+        self._fh = fh
+
+    def write(self, result: Dict[str, Any]) -> None:
+        meters: List[Optional[Dict[str, Any]]] = result["meters"] or [None]
+        for meter in meters:
+            row = {
+                "account": result["account"],
+                "user_info": result["user_info"],
+                "meter": meter,
+                "error": result["error"],
+            }
+            self._fh.write(json.dumps(row, ensure_ascii=False, default=str))
+            self._fh.write("\n")
+
+
+def run_export(
+    accounts: Iterator[Dict[str, str]],
+    out: TextIO,
+    fmt: str = "csv",
+    concurrency: int = 8,
+    timeout: float = 10.0,
+) -> Dict[str, int]:
+    """Export all accounts to out and return account/failure counts."""
+    writer = _CsvWriter(out) if fmt == "csv" else _JsonLinesWriter(out)
+    stats = {"accounts": 0, "failed": 0, "meters": 0}
+
+    # The session is only shared for its connection pool. Accounts must not
+    # see each other's cookies, so the cookie jar accepts none.
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=len(COUNTRY_OPTIONS), pool_maxsize=concurrency)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    def _drain(done) -> None:
+        for future in done:
+            result = future.result()
+            writer.write(result)
+            stats["accounts"] += 1
+            stats["meters"] += len(result["meters"])
+            if result["error"]:
+                stats["failed"] += 1
+
+    # Keep at most a couple of accounts queued per worker so huge account
+    # lists are never materialised in memory.
+    max_in_flight = concurrency * 2
+    with session, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = set()
+        for account in accounts:
+            pending.add(executor.submit(_export_account, account, session, timeout))
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                _drain(done)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            _drain(done)
+
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export ISTA Online meters and user info for many accounts.")
+    parser.add_argument("accounts", help="CSV file with username,password[,country] columns ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Output file ('-' for stdout)")
+    parser.add_argument("-f", "--format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="Accounts fetched in parallel")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds")
+    parser.add_argument("--benchmark", action="store_true", help="Report throughput in accounts per second on stderr")
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    in_fh = sys.stdin if args.accounts == "-" else open(args.accounts, newline="", encoding="utf-8")
+    out_fh = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        started = time.perf_counter()
+        stats = run_export(_read_accounts(in_fh), out_fh, args.format, args.concurrency, args.timeout)
+        elapsed = time.perf_counter() - started
+    finally:
+        if in_fh is not sys.stdin:
+            in_fh.close()
+        if out_fh is not sys.stdout:
+            out_fh.close()
+
+    if args.benchmark:
+        rate = stats["accounts"] / elapsed if elapsed > 0 else 0.0
+        print(
+            f"{stats['accounts']} accounts ({stats['failed']} failed, {stats['meters']} meters) "
+            f"in {elapsed:.2f}s: {rate:.1f} accounts/s at concurrency {args.concurrency}",
+            file=sys.stderr,
+        )
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())